@@ -0,0 +1,123 @@
+# Numba-compiled scanners for the directory/path table byte streams.
+# Names are decoded by the callers in iso.py; numba's string support is
+# too limited to do it here.
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _grow(arr):
+    new = np.empty(arr.size * 2, np.int64)
+    new[:arr.size] = arr
+    return new
+
+
+@njit(cache=True)
+def scan_dir(buf):
+    """Scan a directory table, returning (lbas, sizes, name_offs, name_lens)"""
+    cap = 64
+    lbas = np.empty(cap, np.int64)
+    sizes = np.empty(cap, np.int64)
+    name_offs = np.empty(cap, np.int64)
+    name_lens = np.empty(cap, np.int64)
+    n = 0
+    i = 0
+    while i + 33 <= buf.size:
+        total_len = np.int64(buf[i])
+        if total_len == 0:
+            break
+        if n == cap:
+            lbas = _grow(lbas)
+            sizes = _grow(sizes)
+            name_offs = _grow(name_offs)
+            name_lens = _grow(name_lens)
+            cap *= 2
+        lbas[n] = (
+            np.int64(buf[i+2])
+            | np.int64(buf[i+3]) << 8
+            | np.int64(buf[i+4]) << 16
+            | np.int64(buf[i+5]) << 24
+        )
+        sizes[n] = (
+            np.int64(buf[i+10])
+            | np.int64(buf[i+11]) << 8
+            | np.int64(buf[i+12]) << 16
+            | np.int64(buf[i+13]) << 24
+        )
+        name_offs[n] = i + 33
+        name_lens[n] = np.int64(buf[i+32])
+        n += 1
+        i += total_len
+    return lbas[:n], sizes[:n], name_offs[:n], name_lens[:n]
+
+
+@njit(cache=True)
+def scan_path_le(buf):
+    """Scan a little-endian path table,
+    returning (lbas, parents, name_offs, name_lens)
+    """
+    cap = 64
+    lbas = np.empty(cap, np.int64)
+    parents = np.empty(cap, np.int64)
+    name_offs = np.empty(cap, np.int64)
+    name_lens = np.empty(cap, np.int64)
+    n = 0
+    i = 0
+    while i + 8 <= buf.size:
+        name_len = np.int64(buf[i])
+        if name_len == 0:
+            break
+        if n == cap:
+            lbas = _grow(lbas)
+            parents = _grow(parents)
+            name_offs = _grow(name_offs)
+            name_lens = _grow(name_lens)
+            cap *= 2
+        lbas[n] = (
+            np.int64(buf[i+2])
+            | np.int64(buf[i+3]) << 8
+            | np.int64(buf[i+4]) << 16
+            | np.int64(buf[i+5]) << 24
+        )
+        parents[n] = np.int64(buf[i+6]) | np.int64(buf[i+7]) << 8
+        name_offs[n] = i + 8
+        name_lens[n] = name_len
+        n += 1
+        i += 8 + name_len + (name_len & 1)
+    return lbas[:n], parents[:n], name_offs[:n], name_lens[:n]
+
+
+@njit(cache=True)
+def scan_path_be(buf):
+    """Scan a big-endian path table,
+    returning (lbas, parents, name_offs, name_lens)
+    """
+    cap = 64
+    lbas = np.empty(cap, np.int64)
+    parents = np.empty(cap, np.int64)
+    name_offs = np.empty(cap, np.int64)
+    name_lens = np.empty(cap, np.int64)
+    n = 0
+    i = 0
+    while i + 8 <= buf.size:
+        name_len = np.int64(buf[i])
+        if name_len == 0:
+            break
+        if n == cap:
+            lbas = _grow(lbas)
+            parents = _grow(parents)
+            name_offs = _grow(name_offs)
+            name_lens = _grow(name_lens)
+            cap *= 2
+        lbas[n] = (
+            np.int64(buf[i+2]) << 24
+            | np.int64(buf[i+3]) << 16
+            | np.int64(buf[i+4]) << 8
+            | np.int64(buf[i+5])
+        )
+        parents[n] = np.int64(buf[i+6]) << 8 | np.int64(buf[i+7])
+        name_offs[n] = i + 8
+        name_lens[n] = name_len
+        n += 1
+        i += 8 + name_len + (name_len & 1)
+    return lbas[:n], parents[:n], name_offs[:n], name_lens[:n]
@@ -1,5 +1,6 @@
 from pathlib import Path
 import os
+import sys
 
 import click
 
@@ -8,9 +9,12 @@ from ps2isopatcher.iso import (
 )
 
 def print_tree(root: TreeFolder):
-    for _, _, files in walk_tree(root):
-        for f in files:
-            print(f.path)
+    # One buffered write instead of a print (stdout lock + syscall)
+    # per file
+    lines = [f.path for _, _, files in walk_tree(root) for f in files]
+    if lines:
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
 @click.group()
 def cli():
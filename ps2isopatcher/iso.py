@@ -4,103 +4,95 @@ from pathlib import Path
 from typing import Optional
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 import os
 import logging
+import mmap
+import struct
 from math import ceil
 
-from ps2isopatcher.util import FileBytes, both_endian_int
-
+from ps2isopatcher.util import both_endian_int
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    # Needs numba on top of numpy; guarded separately so a
+    # numpy-only install keeps the structured-dtype fast path
+    from ps2isopatcher import _jit
+except ImportError:
+    _jit = None
+
+# Path table entry header: name length, extended attribute length,
+# extent LBA, parent directory id
+_LPT_HDR = struct.Struct("<BBIH")
+_MPT_HDR = struct.Struct(">BBIH")
+# Directory record fields: record length, extent LBA (LE half),
+# data length (LE half), file identifier length
+_DIR_HDR = struct.Struct("<BxI4xI18xB")
+
+log = logging.getLogger("Ps2Iso")
+if not log.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(
+        logging.Formatter("%(name)s - %(levelname)s - %(message)s"))
+    log.addHandler(_handler)
+    log.setLevel(logging.INFO)
+
+EXPORT_CHUNK_SIZE = 1 << 17
+WRITE_BUFFER_SIZE = 1 << 20
+WRITE_CHUNK_SIZE = 1 << 22
+
+
+# Primary Volume Descriptor fields: system identifier, logical block
+# size, path table size, then the four path table locations.  The
+# m_path_table pair is read little-endian to match the historical
+# behaviour of this parser; only the L table is ever walked.
+_PVD_FMT = struct.Struct("<8x32s88xH2xI4x4I")
 
 # Primary Volume Descriptor
 class PVD:
     PVD_OFFSET = 0x10*2048  # PVD starts after System Area
     PVD_LENGTH = 2048
-    SYST_ID_OFFSET = 8
-    SYST_ID_LENGTH = 32
-    BLOCK_SIZE_OFFSET = 128
-    BLOCK_SIZE_LENGTH = 2
-    PATH_TABLE_SIZE_OFFSET = 132
-    PATH_TABLE_SIZE_LENGTH = 4
-    L_PATH_TABLE_OFFSET = 140
-    L_PATH_TABLE_OPT_OFFSET = 144
-    M_PATH_TABLE_OFFSET = 148
-    M_PATH_TABLE_OPT_OFFSET = 152
-    PATH_TABLE_LENGTH = 4
 
     def __init__(self, iso: "Ps2Iso"):
         """The Primary Volume Descriptor of an ISO9660 file
 
+        All fields are parsed once up front; nothing in the descriptor
+        changes after load.
+
         Args:
-            data: the contents of the ISO file
+            iso: main iso class
         """
-        self.data = iso.data[
-            self.PVD_OFFSET:(self.PVD_OFFSET+self.PVD_LENGTH)
-        ]
-
-    @property
-    def system_identifier(self):
-        return self._get_str(
-            self.SYST_ID_OFFSET, self.SYST_ID_LENGTH)
-
-    @property
-    def logical_block_size(self):
-        return self._get_intle(
-            self.BLOCK_SIZE_OFFSET, self.BLOCK_SIZE_LENGTH)
-
-    @property
-    def path_table_size(self):
-        return self._get_intle(
-            self.PATH_TABLE_SIZE_OFFSET, self.PATH_TABLE_SIZE_LENGTH)
-
-    @property
-    def l_path_table(self):
-        return self._get_intle(
-            self.L_PATH_TABLE_OFFSET, self.PATH_TABLE_LENGTH)
-    @property
-    def l_path_table_opt(self):
-        return self._get_intle(
-            self.L_PATH_TABLE_OPT_OFFSET, self.PATH_TABLE_LENGTH)
-
-    @property
-    def m_path_table(self):
-        return self._get_intle(
-            self.M_PATH_TABLE_OFFSET, self.PATH_TABLE_LENGTH)
-
-    @property
-    def m_path_table_opt(self):
-        return self._get_intle(
-            self.M_PATH_TABLE_OPT_OFFSET, self.PATH_TABLE_LENGTH)
-
-    def _get_intle(self, offset: int, length: int) -> int:
-        e = self._get_entry(offset, length)
-        return int.from_bytes(e, byteorder="little", signed=True)
-
-    def _get_intbe(self, offset: int, length: int) -> int:
-        e = self._get_entry(offset, length)
-        return int.from_bytes(e, byteorder="big", signed=True)
-
-    def _get_str(self, offset: int, length: int) -> str:
-        e = self._get_entry(offset, length)
-        return e.decode().strip()
-
-    def _get_entry(self, offset: int, length: int) -> bytes:
-        return self.data[offset:(offset+length)]
-
-@dataclass
+        (
+            syst_id,
+            self.logical_block_size,
+            self.path_table_size,
+            self.l_path_table,
+            self.l_path_table_opt,
+            self.m_path_table,
+            self.m_path_table_opt,
+        ) = _PVD_FMT.unpack_from(iso._mv, self.PVD_OFFSET)
+        self.system_identifier = syst_id.rstrip(b" \x00").decode("ascii")
+
+@dataclass(slots=True)
 class ObjectEntry:
     name: str
     lba: int
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry(ObjectEntry):
     size: int
 
-@dataclass
+@dataclass(slots=True)
 class PathTableEntry(ObjectEntry):
     parent_dir_id: int
     dir_id: int
 
 class PathTable(ABC):
+    _HDR: struct.Struct
+
     def __init__(self, iso: "Ps2Iso", addr: int, size: int):
         """A path table describing where every file/folder is on disk
 
@@ -109,73 +101,170 @@ class PathTable(ABC):
             addr: address of path table
             size: size of path table
         """
-        self.tbl_data = iso.data[addr:(addr+size)]
+        self.tbl_data = iso._mv[addr:(addr+size)]
 
     def get_entries(self) -> list[PathTableEntry]:
         """Get a list of all entries in the path table"""
-        paths = []
+        if np is not None:
+            entries = self._get_entries_uniform()
+            if entries is not None:
+                return entries
+        if _jit is not None:
+            return self._get_entries_jit()
+        return list(self.iter_entries())
+
+    def iter_entries(self) -> Generator[PathTableEntry, None, None]:
+        """Lazily yield entries in path table order
+
+        Callers that only need to locate one record can stop early
+        without paying to parse the rest of the table.
+        """
+        # Hoist the per-record lookups out of the loop; these resolve
+        # to the same objects every iteration
+        data = self.tbl_data
+        unpack_from = self._HDR.unpack_from
+        get_name = self._get_name
+        end = len(data)
 
         i = 0
         dir_id = 1
-        while i < len(self.tbl_data):
-            name_len = int.from_bytes(self.tbl_data[i:(i+1)])
-            total_len = name_len + 8
-            if name_len % 2:
-                total_len += 1
-            entry = self.tbl_data[i:(i+total_len)]
-            lba = self._get_lba(entry)
-            parent_dir_id = self._get_parent_dir_id(entry)
-            name = self._get_name(entry, name_len)
-            paths.append(PathTableEntry(
-                name=name,
+        while i < end:
+            name_len, _, lba, parent_dir_id = unpack_from(data, i)
+            # Branchless: records are padded to an even length
+            total_len = 8 + name_len + (name_len & 1)
+            yield PathTableEntry(
+                name=get_name(data, i + 8, name_len),
                 lba=lba,
                 parent_dir_id=parent_dir_id,
                 dir_id=dir_id
-            ))
+            )
             i += total_len
             dir_id += 1
-        return paths
 
-    def _get_name(self, entry: bytes, length: int) -> str:
-        return entry[8:(8+length)].decode().strip()
+    def _get_entries_uniform(self) -> Optional[list[PathTableEntry]]:
+        """Decode the whole table with one structured-dtype frombuffer
 
-    @abstractmethod
-    def _get_lba(self, entry: bytes) -> int:
-        pass
+        Only possible when every record after the root shares one name
+        length; returns None otherwise so the caller can fall back to
+        the scalar parsers.
+        """
+        buf = self.tbl_data
+        if len(buf) < 10:
+            return None
+        # The root record is always 10 bytes (1-byte name), so probe
+        # uniformity over the records that follow it
+        root_len, _, root_lba, root_parent = self._HDR.unpack_from(buf, 0)
+        if root_len != 1:
+            return None
+        entries = [PathTableEntry(
+            name=self._get_name(buf, 8, 1),
+            lba=root_lba,
+            parent_dir_id=root_parent,
+            dir_id=1,
+        )]
+        rest = np.frombuffer(buf, np.uint8, offset=10)
+        if rest.size == 0:
+            return entries
+        name_len = int(rest[0])
+        rec_len = 8 + name_len + (name_len & 1)
+        if name_len == 0 or rest.size % rec_len:
+            return None
+        if not (rest[::rec_len] == name_len).all():
+            return None
+        order = "<" if self._HDR.format.startswith("<") else ">"
+        fields = [
+            ("len", "u1"),
+            ("ext", "u1"),
+            ("lba", f"{order}u4"),
+            ("parent", f"{order}u2"),
+            ("name", f"S{name_len}"),
+        ]
+        if name_len & 1:
+            fields.append(("pad", "V1"))
+        arr = np.frombuffer(buf, np.dtype(fields), offset=10)
+        entries.extend(
+            PathTableEntry(
+                name=nm.rstrip(b" ").decode("ascii"),
+                lba=int(lba),
+                parent_dir_id=int(parent),
+                dir_id=dir_id,
+            )
+            for dir_id, (lba, parent, nm) in enumerate(
+                zip(arr["lba"], arr["parent"], arr["name"]), start=2)
+        )
+        return entries
+
+    def _get_entries_jit(self) -> list[PathTableEntry]:
+        buf = np.frombuffer(self.tbl_data, dtype=np.uint8)
+        lbas, parents, name_offs, name_lens = self._scan(buf)
+        return [
+            PathTableEntry(
+                name=self._get_name(self.tbl_data, int(off), int(nl)),
+                lba=int(lba),
+                parent_dir_id=int(parent),
+                dir_id=dir_id,
+            )
+            for dir_id, (lba, parent, off, nl) in enumerate(
+                zip(lbas, parents, name_offs, name_lens), start=1)
+        ]
 
+    def _get_name(self, data, offset: int, length: int) -> str:
+        # ISO9660 names are ASCII d-characters padded with trailing
+        # spaces/NULs; trim on the bytes and take the ascii decoder
+        # fast path
+        return bytes(
+            data[offset:(offset+length)]).rstrip(b"\x00 ").decode("ascii")
+
+    @staticmethod
     @abstractmethod
-    def _get_parent_dir_id(self, entry: bytes) -> int:
+    def _scan(buf):
         pass
 
 
 class LPathTable(PathTable):
-    def _get_lba(self, entry: bytes) -> int:
-        return int.from_bytes(entry[2:6], byteorder="little")
+    _HDR = _LPT_HDR
 
-    def _get_parent_dir_id(self, entry) -> int:
-        return int.from_bytes(entry[6:8], byteorder="little")
+    @staticmethod
+    def _scan(buf):
+        return _jit.scan_path_le(buf)
 
 class MPathTable(PathTable):
-    def _get_lba(self, entry: bytes) -> int:
-        return int.from_bytes(entry[2:6], byteorder="big")
+    _HDR = _MPT_HDR
 
-    def _get_parent_dir_id(self, entry) -> int:
-        return int.from_bytes(entry[6:8], byteorder="big")
+    @staticmethod
+    def _scan(buf):
+        return _jit.scan_path_be(buf)
 
 class PathTables:
     def __init__(self, iso: "Ps2Iso"):
         """Wrapper class to access the path tables on disk"""
         self._iso = iso
-        size = iso.pvd.path_table_size
+        self._size = iso.pvd.path_table_size
         lpt_addr = iso.pvd.l_path_table*2048
-        mpt_addr = iso.pvd.m_path_table*2048
-        self.l_path_table = LPathTable(iso, lpt_addr, size)
-        self.m_path_table = MPathTable(iso, mpt_addr, size)
+        self.l_path_table = LPathTable(iso, lpt_addr, self._size)
+
+    @cached_property
+    def m_path_table(self) -> MPathTable:
+        # Nothing on the read path uses the big-endian table, so it's
+        # only materialised on demand
+        mpt_addr = self._iso.pvd.m_path_table*2048
+        return MPathTable(self._iso, mpt_addr, self._size)
 
     def get_path_tree(self) -> "TreeFolder":
         paths = self.l_path_table.get_entries()
-        root = paths.pop(0)
-        return TreeFolder(self._iso, root, children=paths)
+        root_entry = paths.pop(0)
+        buckets: dict[int, list[PathTableEntry]] = {}
+        for p in paths:
+            buckets.setdefault(p.parent_dir_id, []).append(p)
+        root = TreeFolder(self._iso, root_entry)
+        stack = [root]
+        while stack:
+            folder = stack.pop()
+            for c in buckets.get(folder.id, ()):
+                child = TreeFolder(self._iso, c, parent=folder)
+                folder._add_folder(child)
+                stack.append(child)
+        return root
 
 
 class DirTable:
@@ -188,20 +277,30 @@ class DirTable:
         """
         self._iso = iso
         self.dt_addr = lba*iso.block_size
+        self._name_to_offsets: Optional[dict[str, tuple[int, int]]] = None
 
     def get_entries(self) -> list[FileEntry]:
+        """Get the entries in the table, skipping the "." and ".."
+        records that always lead it
+        """
+        if _jit is not None:
+            return self._get_entries_jit()
         entries = []
 
+        data = self.tbl_data
+        # The block is zero padded after the last record, so the
+        # effective length can be found up front instead of testing for
+        # the terminating zero on every entry
+        end = len(bytes(data).rstrip(b"\x00"))
         i = 0
-        while True:
-            total_len = int.from_bytes(self.tbl_data[i:(i+1)])
-            if total_len == 0:
-                break
-            entry = self.tbl_data[i:(i+total_len)]
-            lba = self._get_lba(entry)
-            size = self._get_size(entry)
-            name_len = self._get_name_length(entry)
-            name = self._get_name(entry, name_len)
+        idx = 0
+        while i < end:
+            total_len, lba, size, name_len = _DIR_HDR.unpack_from(data, i)
+            if idx < 2:
+                idx += 1
+                i += total_len
+                continue
+            name = self._get_name(data, i + 33, name_len)
             entries.append(FileEntry(
                 name=name,
                 size=size,
@@ -210,48 +309,63 @@ class DirTable:
             i += total_len
         return entries
 
+    def _get_entries_jit(self) -> list[FileEntry]:
+        data = self.tbl_data
+        buf = np.frombuffer(data, dtype=np.uint8)
+        lbas, sizes, name_offs, name_lens = _jit.scan_dir(buf)
+        return [
+            FileEntry(
+                name=self._get_name(data, int(off), int(nl)),
+                lba=int(lba),
+                size=int(size),
+            )
+            for lba, size, off, nl in zip(
+                lbas[2:], sizes[2:], name_offs[2:], name_lens[2:])
+        ]
+
     def set_entry(self, name: str, lba: int, size: int):
+        if self._name_to_offsets is None:
+            self._build_offset_index()
+        offsets = self._name_to_offsets.get(name)
+        if offsets is None:
+            self._iso.log.debug(f"No TOC entry named {name}")
+            return
+        lba_offset, size_offset = offsets
+        self._iso.overwrite(both_endian_int(lba), lba_offset)
+        self._iso.overwrite(both_endian_int(size), size_offset)
+
+    def _build_offset_index(self):
+        """Walk the table once, recording where each entry's lba/size live"""
+        offsets = {}
+        data = self.tbl_data
+        end = len(bytes(data).rstrip(b"\x00"))
         idx = 0
-        print(f"Searching for {name}")
-        while True:
-            total_len = self.tbl_data[idx]
-            if total_len == 0:
-                break
-            entry = self.tbl_data[idx:(idx+total_len)]
-            name_len = self._get_name_length(entry)
-            n = self._get_name(entry, name_len)
-            print(n)
-            if n == name:
-                iso_offset = idx + self.dt_addr
-                lba_offset = iso_offset + 2
-                size_offset = iso_offset + 10
-                lba_bytes = both_endian_int(lba)
-                size_bytes = both_endian_int(size)
-                self._iso.overwrite(lba_bytes, lba_offset)
-                self._iso.overwrite(size_bytes, size_offset)
-                break
+        while idx < end:
+            total_len, _, _, name_len = _DIR_HDR.unpack_from(data, idx)
+            n = self._get_name(data, idx + 33, name_len)
+            iso_offset = idx + self.dt_addr
+            offsets[n] = (iso_offset + 2, iso_offset + 10)
             idx += total_len
+        self._name_to_offsets = offsets
 
     @property
-    def tbl_data(self) -> bytes:
-        return self._iso.data[
+    def tbl_data(self) -> memoryview:
+        return self._iso._mv[
             self.dt_addr:(self.dt_addr+self._iso.block_size)
         ]
 
-    def _get_lba(self, entry) -> int:
-        return int.from_bytes(entry[2:6], byteorder="little")
-
-    def _get_size(self, entry) -> int:
-        return int.from_bytes(entry[10:14], byteorder="little")
-
-    def _get_name_length(self, entry) -> int:
-        return int.from_bytes(entry[32:33], byteorder="little")
-
-    def _get_name(self, entry, length) -> str:
-        return entry[33:(33+length)].decode().strip()
+    def _get_name(self, data, offset: int, length: int) -> str:
+        # ISO9660 names are ASCII d-characters padded with trailing
+        # spaces/NULs; trim on the bytes and take the ascii decoder
+        # fast path
+        return bytes(
+            data[offset:(offset+length)]).rstrip(b"\x00 ").decode("ascii")
 
 
 class TreeObject:
+    __slots__ = ("_iso", "_entry", "__parent", "name", "lba",
+                 "path", "path_no_ver")
+
     def __init__(
             self, iso: "Ps2Iso", entry: ObjectEntry,
             parent: Optional["TreeFolder"]=None
@@ -259,39 +373,34 @@ class TreeObject:
         self._iso = iso
         self._entry = entry
         self.__parent = parent
+        # Entries never change after construction, so the fields are
+        # exposed as plain attributes rather than property trampolines
+        self.name = entry.name
+        self.lba = entry.lba
+        if parent is None:
+            self.path = ""
+            self.path_no_ver = ""
+        else:
+            self.path = f"{parent.path}/{entry.name}"
+            self.path_no_ver = f"{parent.path}/{entry.name.split(';')[0]}"
 
     @property
     def parent(self):
         return self.__parent
 
-    @property
-    def name(self):
-        return self._entry.name
-
-    @property
-    def lba(self):
-        return self._entry.lba
-
-    @property
-    def path(self):
-        if self.parent is None:
-            return ""
-        return f"{self.parent.path}/{self.name}"
-
-    @property
-    def path_no_ver(self):
-        if self.parent is None:
-            return ""
-        return f"{self.parent.path}/{self.name.split(';')[0]}"
-
     def update_toc(self, lba: int, size: int):
         self.parent._dirtable.set_entry(self.name, lba, size)
 
 
 class TreeFile(TreeObject):
-    @property
-    def size(self) -> int:
-        return self._entry.size
+    __slots__ = ("size",)
+
+    def __init__(
+            self, iso: "Ps2Iso", entry: FileEntry,
+            parent: Optional["TreeFolder"]=None
+        ):
+        super().__init__(iso, entry, parent=parent)
+        self.size = entry.size
 
     @property
     def data(self) -> bytes:
@@ -324,47 +433,83 @@ class TreeFile(TreeObject):
             name = Path(self.path).name
         else:
             name = Path(self.path).name.rsplit(";", 1)[0]
-        with open(full_dir / name, "wb") as f:
-            f.write(self.data)
+        with open(full_dir / name, "wb", buffering=EXPORT_CHUNK_SIZE) as f:
+            self._write_data(f)
+
+    def _write_data(self, f):
+        """Stream the file contents to an open file without copying the
+        whole file out of the ISO at once
+        """
+        iso = self._iso
+        start = self.lba*iso.block_size
+        if isinstance(iso.data, mmap.mmap) and not iso._mutable:
+            # sendfile may transfer less than asked (Linux caps one
+            # call at ~2 GiB), so loop on the returned count; only
+            # fall back if nothing has been written yet
+            remaining = self.size
+            offset = start
+            try:
+                while remaining:
+                    sent = os.sendfile(f.fileno(), iso._fd, offset,
+                                       remaining)
+                    if sent == 0:
+                        raise OSError("sendfile returned 0")
+                    offset += sent
+                    remaining -= sent
+                return
+            except (AttributeError, OSError):
+                if remaining != self.size:
+                    raise
+        mv = iso._mv[start:(start+self.size)]
+        for off in range(0, self.size, EXPORT_CHUNK_SIZE):
+            f.write(mv[off:(off+EXPORT_CHUNK_SIZE)])
 
 
 class TreeFolder(TreeObject):
+    __slots__ = ("id", "_children", "_by_name", "_dirtable",
+                 "_files_loaded")
+
     def __init__(
             self, iso: "Ps2Iso", entry: PathTableEntry, parent=None,
-            children: Optional[list[PathTableEntry]]=None,
         ):
         super().__init__(iso, entry, parent=parent)
+        self.id = entry.dir_id
         self._children: list[TreeObject] = []
-        if children:
-            direct_children = list(filter(
-                lambda x: x.parent_dir_id == self.id, children))
-            for c in direct_children:
-                children.remove(c)
-            for c in direct_children:
-                child = TreeFolder(
-                    self._iso, c, parent=self, children=children)
-                self._children.append(child)
+        self._by_name: dict[str, TreeObject] = {}
         self._dirtable = DirTable(self._iso, self.lba)
-        file_entries = self._dirtable.get_entries()
-
-        files = []
-        for entry in file_entries:
-            files.append(TreeFile(self._iso, entry, parent=self))
-        # Skip the "." and ".." entries
-        files = files[2:]
-        self._children.extend(files)
+        # Parsing the directory table is deferred until the files are
+        # actually needed, so opening an ISO doesn't decode every
+        # directory on the disc
+        self._files_loaded = False
+
+    def _add_folder(self, child: "TreeFolder"):
+        self._children.append(child)
+        # first entry wins, matching the old linear scan
+        self._by_name.setdefault(child.name, child)
+
+    def _load_files(self):
+        if self._files_loaded:
+            return
+        self._files_loaded = True
+        for entry in self._dirtable.get_entries():
+            f = TreeFile(self._iso, entry, parent=self)
+            self._children.append(f)
+            self._by_name.setdefault(f.name, f)
 
     def get_child(self, name: str) -> TreeObject:
-        return next(i for i in self.children if i.name == name)
+        # Folder children come straight from the path table; only hit
+        # the directory table if the name isn't a folder
+        child = self._by_name.get(name)
+        if child is not None:
+            return child
+        self._load_files()
+        return self._by_name[name]
 
     @property
     def children(self) -> list[TreeObject]:
+        self._load_files()
         return self._children
 
-    @property
-    def id(self) -> int:
-        return self._entry.dir_id
-
 def walk_tree(
         root: TreeFolder
 ) -> Generator[
@@ -387,6 +532,8 @@ def walk_tree(
         folders.extend(subfolders)
 
 class Ps2Iso:
+    _ZERO_PAGE = bytes(65536)
+
     def __init__(self, filename: str | os.PathLike, mutable: bool=False):
         """A class to manipulate PS2 ISOs (ISO9660)
 
@@ -394,19 +541,24 @@ class Ps2Iso:
             filename: path to an ISO file
             mutable: set to True to allow modifying of the data in memory (SLOW)
         """
-        self._set_logger()
-        if mutable:
-            self.log.info(f"Loading {filename}, this may take a while...")
-            with open(filename, "rb") as f:
-                self.data = bytearray(f.read())
-        else:
-            self.data = FileBytes(filename)
+        self.log = log
+        self._mutable = mutable
+        self._fd = os.open(filename, os.O_RDONLY)
+        # ACCESS_COPY gives copy-on-write pages, so a mutable ISO no
+        # longer needs the whole file slurped into a bytearray
+        access = mmap.ACCESS_COPY if mutable else mmap.ACCESS_READ
+        self.data = mmap.mmap(self._fd, 0, access=access)
+        self._mv = memoryview(self.data)
+        # End of the image itself; the backing buffer may be larger
+        # once overwrite() has preallocated growth room
+        self._logical_end = len(self.data)
         self.pvd = PVD(self)
         self.block_size = self.pvd.logical_block_size
 
-        if self.pvd.system_identifier != "PLAYSTATION":
+        sid = self.pvd.system_identifier
+        if sid != "PLAYSTATION":
             self.log.warning((
-                f"system_identifier is: '{self.pvd.system_identifier}', "
+                f"system_identifier is: '{sid}', "
                 "but should be 'PLAYSTATION'"))
             self.log.warning(
                 f"{filename} may not be a PS2 ISO file")
@@ -419,24 +571,40 @@ class Ps2Iso:
 
         self.path_tables = PathTables(self)
         self._tree = self.path_tables.get_path_tree()
+        self._lba_list: Optional[list[tuple[int, str]]] = None
+        self._path_to_lba_idx: Optional[dict[str, int]] = None
+        self._obj_cache: dict[str, TreeObject] = {}
 
     @property
     def tree(self):
         return self._tree
 
     def get_object(self, path: str) -> TreeObject:
+        obj = self._obj_cache.get(path)
+        if obj is not None:
+            return obj
         paths = path.split("/")
         if paths[0] == "":
             paths.pop(0)
         mark = self.tree
         for p in paths:
             mark = mark.get_child(p)
+        self._obj_cache[path] = mark
         return mark
 
     def get_blocks_allocated(self, path: str) -> int:
         """Get the number of blocks currently available to a path"""
         lba_list = self.get_lba_list()
-        obj_idx = next(idx for idx, i in enumerate(lba_list) if i[1] == path)
+        return self._blocks_allocated_from_list(
+            lba_list, self._path_to_lba_idx, path)
+
+    def _blocks_allocated_from_list(
+            self,
+            lba_list: list[tuple[int, str]],
+            path_to_idx: dict[str, int],
+            path: str,
+        ) -> int:
+        obj_idx = path_to_idx[path]
         lba = lba_list[obj_idx][0]
         try:
             next_lba = lba_list[obj_idx + 1][0]
@@ -458,8 +626,13 @@ class Ps2Iso:
         bins = [b for _, b in replacements]
         sizes = [len(b) for b in bins]
         blocks_required = [self.blocks_required(b) for b in bins]
-        curr_lba = [self.get_lba(p) for p in paths]
-        curr_blocks_allocated = [self.get_blocks_allocated(p) for p in paths]
+        lba_list = self.get_lba_list()
+        path_to_idx = self._path_to_lba_idx
+        objs = {p: self.get_object(p) for p in paths}
+        curr_lba = [objs[p].lba for p in paths]
+        curr_blocks_allocated = [
+            self._blocks_allocated_from_list(lba_list, path_to_idx, p)
+            for p in paths]
 
         items = [
             {
@@ -496,26 +669,54 @@ class Ps2Iso:
                 new_lba = lba
             offset = new_lba*self.block_size
             self.overwrite(i["bin"], offset)
-            self.update_toc(i["path"], new_lba, i["size"])
+            objs[i["path"]].update_toc(new_lba, i["size"])
 
     def update_toc(self, path, lba, size):
         self.get_object(path).update_toc(lba, size)
+        self._invalidate_lba_cache()
 
     def write(self, filename):
-        with open(filename, "wb") as f:
-            f.write(self.data)
+        mv = self._mv[:self._logical_end]
+        with open(filename, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            for off in range(0, len(mv), WRITE_CHUNK_SIZE):
+                f.write(mv[off:(off+WRITE_CHUNK_SIZE)])
 
     def clear_blocks(self, start_block, num_blocks):
-        start_addr = start_block*self.block_size
-        blank_data = bytes(num_blocks*self.block_size)
-        self.overwrite(blank_data, start_addr)
+        if not self._mutable:
+            raise ValueError("Can not mutate an immutable Ps2Iso")
+        self._invalidate_lba_cache()
+        # Blast zeroes in from a shared page instead of materialising
+        # one zero buffer the size of the whole range
+        off = start_block*self.block_size
+        remaining = num_blocks*self.block_size
+        zero = self._ZERO_PAGE
+        while remaining:
+            n = min(len(zero), remaining)
+            self.data[off:(off+n)] = zero[:n]
+            off += n
+            remaining -= n
 
     def get_lba_list(self) -> list[tuple[int, str]]:
-        """Get a list containing all paths on disk and their associated lba"""
-        root = self.tree
-        lba_list = self._get_lba_list(root)
-        lba_list = list(set(lba_list))
-        return sorted(lba_list, key=lambda x: x[0])
+        """Get a list containing all paths on disk and their associated lba
+
+        The list is cached until the next write to the image.
+        """
+        if self._lba_list is None:
+            out: dict[int, str] = {}
+            stack: list[TreeObject] = [self.tree]
+            while stack:
+                item = stack.pop()
+                out.setdefault(item.lba, item.path)
+                if isinstance(item, TreeFolder):
+                    stack.extend(item.children)
+            self._lba_list = sorted(out.items())
+            self._path_to_lba_idx = {
+                p: idx for idx, (_, p) in enumerate(self._lba_list)}
+        return self._lba_list
+
+    def _invalidate_lba_cache(self):
+        self._lba_list = None
+        self._path_to_lba_idx = None
 
     def overwrite(self, data: bytes, addr: int):
         """Overwrite the underlying data on the disk
@@ -524,14 +725,32 @@ class Ps2Iso:
             data: data to overwrite
             addr: address to start writing at
         """
-        if not isinstance(self.data, bytearray):
+        if not self._mutable:
             raise ValueError("Can not mutate an immutable Ps2Iso")
+        self._invalidate_lba_cache()
         end_addr = addr + len(data)
         diff = end_addr - len(self.data)
         if diff > 0:
-            num_blocks = self.blocks_required(diff)
-            self.data += bytearray(num_blocks*self.block_size)
+            self._mv.release()
+            if isinstance(self.data, mmap.mmap):
+                # ACCESS_COPY maps can't be resized, so fall back to an
+                # in-memory buffer the first time the image has to grow.
+                # The old map is left open behind any views still held
+                # by PVD/PathTable.
+                self.data = bytearray(self.data)
+            # Grow geometrically so a batch of appending writes doesn't
+            # realloc-and-copy the whole buffer per file; write() trims
+            # the slack back off via _logical_end
+            new_size = max(
+                self.blocks_required(end_addr)*self.block_size,
+                len(self.data)*2,
+            )
+            self.data += bytearray(new_size - len(self.data))
+            self._mv = memoryview(self.data)
         self.data[addr:addr + len(data)] = data
+        new_end = self.blocks_required(end_addr)*self.block_size
+        if new_end > self._logical_end:
+            self._logical_end = new_end
 
     def blocks_required(self, data: bytes | int) -> int:
         """Calculate the blocks required to store data"""
@@ -541,27 +760,57 @@ class Ps2Iso:
             size = data
         return ceil(size/self.block_size)
 
-    def _get_lba_list(self, item: TreeObject, lba_list=None):
-        if lba_list is None:
-            lba_list = []
-        lba = item.lba
-        path = item.path
-        lba_list.append((lba, path))
-        if isinstance(item, TreeFolder):
-            for c in item.children:
-                self._get_lba_list(c,lba_list=lba_list)
-        return lba_list
-
-    def _get_blocks(self, lba, blocks=None, size=None):
-        if blocks and size is None:
+    def _get_blocks(self, lba, blocks=None, size=None) -> memoryview:
+        """Read a run of blocks starting at lba
+
+        With the image memory mapped this is a zero-copy view;
+        scattered block reads are serviced by the page cache without a
+        syscall per block.
+        """
+        if blocks is not None and size is None:
             size = blocks*self.block_size
         if size is None:
             raise ValueError("blocks/size must be set")
+        start = lba*self.block_size
+        return self._mv[start:(start+size)]
 
-    def _set_logger(self):
-        self.log = logging.getLogger("Ps2Iso")
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        self.log.addHandler(handler)
-        self.log.setLevel(logging.INFO)
+    def close(self):
+        """Release the mapping and file descriptor
+
+        Safe to call more than once; also runs from __del__ and
+        __exit__.
+        """
+        # Guard with getattr so a failed __init__ doesn't raise again
+        if getattr(self, "_fd", None) is None:
+            return
+        # Drop the views we hand out internally so the map can unmap
+        tables = getattr(self, "path_tables", None)
+        if tables is not None:
+            tables.l_path_table.tbl_data.release()
+            mpt = tables.__dict__.get("m_path_table")
+            if mpt is not None:
+                mpt.tbl_data.release()
+        if getattr(self, "_mv", None) is not None:
+            self._mv.release()
+            self._mv = None
+        data = getattr(self, "data", None)
+        if isinstance(data, mmap.mmap):
+            # After a growing overwrite() self.data is a bytearray and
+            # the original map is owned by whatever views remain
+            try:
+                data.close()
+            except BufferError:
+                # Caller still holds exported views (e.g. TreeFile
+                # data); the map unmaps once they are released
+                pass
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self) -> "Ps2Iso":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
@@ -1,47 +1,56 @@
+import mmap
 import os
+import struct
+from functools import lru_cache
 
-class FileBytes(bytes):
-    def __new__(cls, filename):
-        instance = super().__new__(cls)
-        instance.file = open(filename, 'rb')
-        instance.__file_size = instance._get_file_size()
-        return instance
+_LE4 = struct.Struct("<I")
+_BE4 = struct.Struct(">I")
+
+class FileBytes:
+    __slots__ = ("_fd", "_mm")
+
+    def __init__(self, filename):
+        self._fd = os.open(filename, os.O_RDONLY)
+        # Reads are served straight from the page cache instead of a
+        # seek+read syscall pair per access
+        self._mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+
+    def __bytes__(self) -> bytes:
+        return self._mm[:]
 
     @property
     def file_size(self) -> int:
-        return self.__file_size
+        return len(self._mm)
 
     def __getitem__(self, index: int | slice) -> int | bytes:
-        if isinstance(index, slice):
-            start, stop, step = index.indices(self.file_size)
-            self.file.seek(start, os.SEEK_SET)
-            return self.file.read(stop - start)[::step]
-        elif isinstance(index, int):
-            if index < 0:
-                index += self.__file_size
-            self.file.seek(index, os.SEEK_SET)
-            return self.file.read(1)[0]
-        else:
-            raise TypeError("Index must be an integer or slice")
+        if isinstance(index, (int, slice)):
+            return self._mm[index]
+        raise TypeError("Index must be an integer or slice")
 
     def __len__(self) -> int:
-        return self.file_size
-
-    def _get_file_size(self) -> int:
-        current_position = self.file.tell()
-        self.file.seek(0, os.SEEK_END)
-        size = self.file.tell()
-        self.file.seek(current_position, os.SEEK_SET)
-        return size
+        return len(self._mm)
 
     def close(self):
-        self.file.close()
+        # Guard with getattr so a failed __init__ doesn't raise again
+        # from __del__; either syscall can be the one that failed
+        # (missing file, or mmap of an empty file)
+        if getattr(self, "_fd", None) is None:
+            return
+        if getattr(self, "_mm", None) is not None:
+            self._mm.close()
+        os.close(self._fd)
+        self._fd = None
+
+    def __enter__(self) -> "FileBytes":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def __del__(self):
         self.close()
 
 
+@lru_cache(maxsize=1024)
 def both_endian_int(val: int) -> bytes:
-    le = val.to_bytes(length=4, byteorder="little")
-    be = val.to_bytes(length=4, byteorder="big")
-    return le + be
\ No newline at end of file
+    return _LE4.pack(val) + _BE4.pack(val)
\ No newline at end of file